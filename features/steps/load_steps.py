@@ -23,40 +23,32 @@ For information on Waiting until elements are present in the HTML see:
     https://selenium-python.readthedocs.io/waits.html
 """
 from behave import given
-from service import app
+from service.models import Product
 
-HTTP_200_OK = 200
-HTTP_201_CREATED = 201
-HTTP_204_NO_CONTENT = 204
+_TRUTHY = frozenset({"true", "1", "yes"})
 
 
 @given("the following products")
 def step_impl(context):
     """Delete all Products and load the ones in context.table."""
-    # Use Flask’s in-process test client – no live server needed
-    context.client = app.test_client()
+    # Talk to the models in-process – no HTTP round-trip per row
 
     # -----------------------------------------------------------------
     # 1) PURGE existing rows
     # -----------------------------------------------------------------
-    resp = context.client.get("/products")
-    assert resp.status_code == HTTP_200_OK
-    for product in resp.get_json():
-        resp = context.client.delete(f"/products/{product['id']}")
-        assert resp.status_code == HTTP_204_NO_CONTENT
+    Product.delete_all()
 
     # -----------------------------------------------------------------
     # 2) INSERT rows from the Background table
     # -----------------------------------------------------------------
-    for row in context.table:
-        payload = {
+    payloads = [
+        {
             "name":        row["name"],
             "description": row["description"],
             "price":       row["price"],
-            "available":   row["available"].lower() in ["true", "1", "yes"],
+            "available":   row["available"].lower() in _TRUTHY,
             "category":    row["category"],
         }
-        resp = context.client.post("/products", json=payload)
-        assert resp.status_code == HTTP_201_CREATED, (
-            f"Seed load failed: {resp.status_code} – {resp.data}"
-        )
\ No newline at end of file
+        for row in context.table
+    ]
+    Product.bulk_create(payloads)
@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, inspect
 
 logger = logging.getLogger("flask.app")
 
@@ -72,12 +73,12 @@ class Product(db.Model):
     # Table Schema
     ##################################################
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
+    name = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.String(250), nullable=False)
     price = db.Column(db.Numeric, nullable=False)
-    available = db.Column(db.Boolean(), nullable=False, default=True)
+    available = db.Column(db.Boolean(), nullable=False, default=True, index=True)
     category = db.Column(
-        db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
+        db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name), index=True
     )
 
     ##################################################
@@ -114,13 +115,23 @@ class Product(db.Model):
 
     def serialize(self) -> dict:
         """Serializes a Product into a dictionary"""
+        state = inspect(self)
+        if state.expired_attributes or state.session is None:
+            # let the ORM load (or refuse to load) the values as usual
+            data = {
+                column: getattr(self, column)
+                for column in ("id", "name", "description", "price", "available", "category")
+            }
+        else:
+            # read the loaded values directly instead of through the ORM descriptors
+            data = self.__dict__
         return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "price": str(self.price),
-            "available": self.available,
-            "category": self.category.name  # convert enum to string
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "description": data.get("description"),
+            "price": str(data.get("price")),
+            "available": data.get("available"),
+            "category": data.get("category").name  # convert enum to string
         }
 
     def deserialize(self, data: dict):
@@ -169,12 +180,49 @@ class Product(db.Model):
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
 
+    @classmethod
+    def bulk_create(cls, rows: list) -> list:
+        """Creates many Products with a single INSERT
+
+        :param rows: dictionaries in the form accepted by deserialize()
+        :type rows: list
+
+        :return: the ids of the new Products
+        :rtype: list
+
+        """
+        logger.info("Creating %d Products", len(rows))
+        if not rows:
+            return []
+        values = []
+        for row in rows:
+            product = cls().deserialize(row)
+            values.append(
+                {
+                    "name": product.name,
+                    "description": product.description,
+                    "price": product.price,
+                    "available": product.available,
+                    "category": product.category,
+                }
+            )
+        ids = db.session.execute(insert(cls).values(values).returning(cls.id)).scalars().all()
+        db.session.commit()
+        return ids
+
     @classmethod
     def all(cls) -> list:
         """Returns all of the Products in the database"""
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def delete_all(cls):
+        """Removes all of the Products from the data store"""
+        logger.info("Deleting all Products")
+        cls.query.delete()
+        db.session.commit()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -18,12 +18,23 @@
 """
 Product Store Service with UI
 """
-from flask import jsonify, request, abort
+from hashlib import sha1
+import orjson
+from flask import jsonify, request, abort, stream_with_context
 from flask import url_for  # noqa: F401 pylint: disable=unused-import
 from service.models import Product, Category
 from service.common import status  # HTTP Status Codes
 from . import app
 
+# Number of encoded Products written per chunk of a streamed listing
+STREAM_BATCH_SIZE = 100
+
+# Lookup tables for the list query parameters
+_CATEGORY_BY_NAME = {category.name: category for category in Category}
+_AVAILABILITY = {
+    "true": True, "1": True, "yes": True,
+    "false": False, "0": False, "no": False,
+}
 
 
 ######################################################################
@@ -47,19 +58,44 @@ def index():
 ######################################################################
 #  U T I L I T Y   F U N C T I O N S
 ######################################################################
-def check_content_type(content_type):
-    """Checks that the media type is correct"""
-    if "Content-Type" not in request.headers:
-        app.logger.error("No Content-Type specified.")
-        abort(
-            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            f"Content-Type must be {content_type}",
+def serialize_stream(products):
+    """Yields a list of Products as a JSON array in batches of encoded rows"""
+    if not products:
+        yield b"[]"
+        return
+    separator = b"["
+    for start in range(0, len(products), STREAM_BATCH_SIZE):
+        batch = products[start:start + STREAM_BATCH_SIZE]
+        yield separator + b",".join(orjson.dumps(product.serialize()) for product in batch)
+        separator = b","
+    yield b"]"
+
+
+def product_etag(product):
+    """Returns an ETag derived from the stored values of a Product
+
+    The values are read straight from the row so a 304 never serializes the
+    Product; a full 200 response pays for this hash on top of serialize().
+    """
+    state = repr(
+        (
+            product.id, product.name, product.description,
+            product.price, product.available, product.category.name,
         )
+    )
+    return sha1(state.encode("utf-8")).hexdigest()
+
 
-    if request.headers["Content-Type"] == content_type:
+def check_content_type(content_type):
+    """Checks that the media type is correct"""
+    request_type = request.content_type
+    if request_type == content_type:
         return
 
-    app.logger.error("Invalid Content-Type: %s", request.headers["Content-Type"])
+    if request_type is None:
+        app.logger.error("No Content-Type specified.")
+    else:
+        app.logger.error("Invalid Content-Type: %s", request_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {content_type}",
@@ -87,13 +123,31 @@ def create_products():
 
     message = product.serialize()
 
-    #
-    # Uncomment this line of code once you implement READ A PRODUCT
-    #
-    location_url = url_for("get_products", product_id=product.id, _external=True)
+    # Same URL as url_for("get_products", ..., _external=True) without reverse routing
+    location_url = f"{request.url_root}products/{product.id}"
     return jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
 
 
+######################################################################
+# C R E A T E   M A N Y   P R O D U C T S
+######################################################################
+@app.route("/products/bulk", methods=["POST"])
+def create_products_bulk():
+    """
+    Creates many Products
+    This endpoint will create every Product in the JSON array that is posted
+    """
+    app.logger.info("Request to Create Products in bulk...")
+    check_content_type("application/json")
+
+    data = request.get_json()
+    if not isinstance(data, list):
+        abort(status.HTTP_400_BAD_REQUEST, "Request body must be a JSON array of products")
+    ids = Product.bulk_create(data)
+    app.logger.info("Products with new ids %s saved!", ids)
+    return jsonify(ids), status.HTTP_201_CREATED
+
+
 ######################################################################
 # L I S T   A L L   P R O D U C T S
 ######################################################################
@@ -109,24 +163,23 @@ def list_products():
     if name:
         products = Product.find_by_name(name)
     elif category:
-        try:
-            category_enum = Category[category]
-        except KeyError:
+        category_enum = _CATEGORY_BY_NAME.get(category)
+        if category_enum is None:
             abort(status.HTTP_400_BAD_REQUEST, f"Unknown category '{category}'")
         products = Product.find_by_category(category_enum)
     elif available is not None:
-        if available.lower() in ["true", "1", "yes"]:
-            avail_bool = True
-        elif available.lower() in ["false", "0", "no"]:
-            avail_bool = False
-        else:
+        avail_bool = _AVAILABILITY.get(available.lower())
+        if avail_bool is None:
             abort(status.HTTP_400_BAD_REQUEST, "available must be true or false")
         products = Product.find_by_availability(avail_bool)
     else:
         products = Product.all()
 
-    results = [p.serialize() for p in products]
-    return jsonify(results), status.HTTP_200_OK
+    return app.response_class(
+        stream_with_context(serialize_stream(products)),
+        status=status.HTTP_200_OK,
+        mimetype="application/json",
+    )
 
 ######################################################################
 # R E A D   A   P R O D U C T
@@ -139,7 +192,17 @@ def get_products(product_id):
     product = Product.find(product_id)
     if not product:
         abort(status.HTTP_404_NOT_FOUND, f"Product with id '{product_id}' was not found.")
-    return jsonify(product.serialize()), status.HTTP_200_OK
+
+    # Skip serializing a Product the client already has
+    etag = product_etag(product)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = jsonify(product.serialize())
+    response.set_etag(etag)
+    return response
+
+
 ######################################################################
 # U P D A T E   A   P R O D U C T
 ######################################################################
@@ -173,3 +236,15 @@ def delete_products(product_id):
         abort(status.HTTP_404_NOT_FOUND, f"Product with id '{product_id}' was not found.")
     product.delete()
     return "", status.HTTP_204_NO_CONTENT
+
+
+######################################################################
+# D E L E T E   A L L   P R O D U C T S
+######################################################################
+
+@app.route("/products", methods=["DELETE"])
+def delete_all_products():
+    """Delete all Products"""
+    app.logger.info("Request to Delete all products")
+    Product.delete_all()
+    return "", status.HTTP_204_NO_CONTENT
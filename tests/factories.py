@@ -56,3 +56,15 @@ class ProductFactory(factory.Factory):
             Category.TOOLS,
         ]
     )
+
+
+# Field values of one fake product, built once and reused by copy_products()
+PRODUCT_TEMPLATE = {
+    field: getattr(ProductFactory.build(), field)
+    for field in ("description", "price", "available", "category")
+}
+
+
+def copy_products(count: int) -> list:
+    """Creates unsaved Products that differ only by name, without calling Faker"""
+    return [Product(name=f"Product {n}", **PRODUCT_TEMPLATE) for n in range(count)]